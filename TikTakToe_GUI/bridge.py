@@ -0,0 +1,257 @@
+import argparse
+import asyncio
+import socket
+import time
+from urllib.parse import urlparse
+
+import serial
+
+
+BRIDGE_SCHEME = 'tcp'
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+CLIENT_QUEUE_SIZE = 64
+
+ROLE_CONTROL = 'CONTROL'
+ROLE_SPECTATOR = 'SPECTATOR'
+
+
+class BridgeClient:
+    """One TCP client of the bridge with its own bounded outgoing queue."""
+
+    def __init__(self, reader, writer, role, queue_size):
+        self.reader = reader
+        self.writer = writer
+        self.role = role
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def send(self, line):
+        # Drop the oldest line instead of making the serial reader wait
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(line)
+
+
+class SerialBridge:
+    """Owns the Arduino serial connection and shares it over a local TCP port.
+
+    The first client to connect gets control and its commands are forwarded
+    to the board. Every other client is a spectator. Every line read from the
+    board (the BOARD: stream, OK: replies) goes to all clients, while ERR:
+    replies go only to the controller. When the controller disconnects, the
+    next client to connect takes control.
+    """
+
+    def __init__(self, serial_conn, host=DEFAULT_HOST, port=DEFAULT_PORT,
+                 queue_size=CLIENT_QUEUE_SIZE):
+        self.serial_conn = serial_conn
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.clients = set()
+        self.controller = None
+        self.server = None
+        self.running = False
+        self.reader_task = None
+
+    async def start(self):
+        self.running = True
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        # Port 0 asks the OS for a free port, so report the one actually bound
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.reader_task = asyncio.create_task(self.read_serial())
+
+    def close(self):
+        self.running = False
+        if self.server:
+            self.server.close()
+        for client in list(self.clients):
+            client.writer.close()
+
+    async def stop(self):
+        self.close()
+        if self.server:
+            await self.server.wait_closed()
+        if self.reader_task and not self.reader_task.done():
+            await self.reader_task
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            # The reader only finishes on stop() or when the board is lost
+            await self.reader_task
+        finally:
+            await self.stop()
+
+    def serial_failed(self, error):
+        # Without the board there is nothing to share, disconnect everyone
+        print(f"Serial port error: {error}")
+        self.close()
+
+    async def read_serial(self):
+        loop = asyncio.get_running_loop()
+        while self.running:
+            try:
+                # pyserial blocks, so read in a worker thread
+                data = await loop.run_in_executor(None, self.serial_conn.readline)
+            except serial.SerialException as e:
+                self.serial_failed(e)
+                break
+            line = data.decode(errors='replace').strip()
+            if line:
+                self.broadcast(line)
+
+    def broadcast(self, line):
+        if line.startswith("ERR:"):
+            # Errors answer the controller's commands, spectators did nothing wrong
+            if self.controller:
+                self.controller.send(line)
+            return
+        for client in self.clients:
+            client.send(line)
+
+    async def write_serial(self, line):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.serial_conn.write, f"{line}\n".encode())
+
+    async def handle_client(self, reader, writer):
+        role = ROLE_SPECTATOR if self.controller else ROLE_CONTROL
+        client = BridgeClient(reader, writer, role, self.queue_size)
+        if role == ROLE_CONTROL:
+            self.controller = client
+        self.clients.add(client)
+        client.send(f"OK:{role}")
+        pump_task = asyncio.create_task(self.pump(client))
+
+        try:
+            while self.running:
+                data = await reader.readline()
+                if not data:
+                    break
+                line = data.decode(errors='replace').strip()
+                if not line:
+                    # Keep-alive newlines from the GUI are not for the board
+                    continue
+                if client is self.controller:
+                    try:
+                        await self.write_serial(line)
+                    except serial.SerialException as e:
+                        self.serial_failed(e)
+                        break
+                else:
+                    client.send("ERR:SPECTATOR")
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.discard(client)
+            if client is self.controller:
+                self.controller = None
+            pump_task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    async def pump(self, client):
+        try:
+            while True:
+                line = await client.queue.get()
+                client.writer.write(f"{line}\n".encode())
+                await client.writer.drain()
+        except ConnectionError:
+            pass
+
+
+class BridgeConnection:
+    """Client side of the bridge with the part of the serial.Serial API the GUI uses."""
+
+    def __init__(self, host, port=DEFAULT_PORT, timeout=1):
+        self.timeout = timeout
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.buffer = b''
+        greeting = self.readline().decode().strip()
+        if not greeting.startswith("OK:"):
+            self.sock.close()
+            raise serial.SerialException(f"Unexpected bridge greeting: {greeting!r}")
+        self.role = greeting[3:]
+
+    @classmethod
+    def from_url(cls, url, timeout=1):
+        parsed = urlparse(url)
+        if parsed.scheme != BRIDGE_SCHEME or not parsed.hostname:
+            raise ValueError(f"Invalid bridge URL: {url}")
+        return cls(parsed.hostname, parsed.port or DEFAULT_PORT, timeout)
+
+    @staticmethod
+    def is_bridge_url(port):
+        return port.startswith(f"{BRIDGE_SCHEME}://")
+
+    @property
+    def is_spectator(self):
+        return self.role == ROLE_SPECTATOR
+
+    @property
+    def in_waiting(self):
+        self.sock.setblocking(False)
+        try:
+            while True:
+                chunk = self.sock.recv(4096)
+                if not chunk:
+                    raise serial.SerialException("Bridge closed the connection")
+                self.buffer += chunk
+        except BlockingIOError:
+            pass
+        finally:
+            self.sock.settimeout(self.timeout)
+        # Only complete lines count, so readline() never waits for the rest
+        return self.buffer.rfind(b'\n') + 1
+
+    def write(self, data):
+        self.sock.sendall(data)
+        return len(data)
+
+    def readline(self):
+        deadline = time.monotonic() + self.timeout
+        while b'\n' not in self.buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return b''
+            self.sock.settimeout(remaining)
+            try:
+                chunk = self.sock.recv(4096)
+            except socket.timeout:
+                return b''
+            if not chunk:
+                raise serial.SerialException("Bridge closed the connection")
+            self.buffer += chunk
+        line, _, self.buffer = self.buffer.partition(b'\n')
+        return line + b'\n'
+
+    def close(self):
+        self.sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Share one Arduino between several Tic Tac Toe clients")
+    parser.add_argument('serial_port', help="Serial port of the Arduino, e.g. COM3")
+    parser.add_argument('--baud', type=int, default=9600)
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    serial_conn = serial.Serial(args.serial_port, args.baud, timeout=1)
+    bridge = SerialBridge(serial_conn, args.host, args.port)
+    print(f"Bridge listening on {BRIDGE_SCHEME}://{args.host}:{args.port}")
+    try:
+        asyncio.run(bridge.serve_forever())
+    except KeyboardInterrupt:
+        print("\nBridge stopped")
+    finally:
+        serial_conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,9 @@
 import sys
-import configparser
 import serial
 import serial.tools.list_ports
 import os
+import bridge
+import settings
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout,
                              QHBoxLayout, QWidget, QComboBox, QLabel, QMessageBox,
                              QGridLayout)
@@ -10,10 +11,13 @@ from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QPalette, QColor
 
 
+BAUD_RATES = ['9600', '19200', '38400', '57600', '115200']
+
 
 class TicTacToeGUI(QMainWindow):
     def __init__(self):
         super().__init__()
+        self.config = settings.ConfigStore()
         self.init_ui()
         self.init_game_state()
         self.init_timers()
@@ -197,6 +201,8 @@ class TicTacToeGUI(QMainWindow):
 
         # Port selection
         self.port_combo = QComboBox()
+        self.port_combo.setEditable(True)
+        self.port_combo.setToolTip("Serial port or bridge URL (tcp://host:port)")
         self.refresh_ports()
         conn_layout.addWidget(QLabel("Port:"))
         conn_layout.addWidget(self.port_combo)
@@ -209,9 +215,9 @@ class TicTacToeGUI(QMainWindow):
 
         # Baud rate selection
         self.baud_combo = QComboBox()
-        self.baud_combo.addItems(['9600', '19200', '38400', '57600', '115200'])
-        self.config = self.load_config()
-        self.baud_combo.setCurrentText(self.config.get('Serial', 'baud_rate', fallback='9600'))
+        self.baud_combo.addItems(BAUD_RATES)
+        # Start from the last baud rate a board answered at
+        self.baud_combo.setCurrentText(self.config.get('Serial', 'baud_rate'))
         conn_layout.addWidget(QLabel("Baud:"))
         conn_layout.addWidget(self.baud_combo)
 
@@ -226,7 +232,7 @@ class TicTacToeGUI(QMainWindow):
         mode_layout = QHBoxLayout()
         self.mode_combo = QComboBox()
         self.mode_combo.addItems(['Man vs Man', 'Man vs AI', 'AI vs AI'])
-        self.mode_combo.setCurrentText(self.config.get('Game', 'default_mode', fallback='Man vs Man'))
+        self.mode_combo.setCurrentText(self.config.get('Game', 'default_mode'))
         self.mode_combo.currentIndexChanged.connect(self.change_mode)
         mode_layout.addWidget(QLabel("Game Mode:"))
         mode_layout.addWidget(self.mode_combo)
@@ -271,23 +277,12 @@ class TicTacToeGUI(QMainWindow):
         self.connection_timer.timeout.connect(self.check_connection)
         self.connection_timer.start(1000)
 
-    def load_config(self):
-        config = configparser.ConfigParser()
-        try:
-            config.read('tictactoe.ini')
-        except:
-            config['Serial'] = {'baud_rate': '9600'}
-            config['Game'] = {'default_mode': 'Man vs Man'}
-            with open('tictactoe.ini', 'w') as f:
-                config.write(f)
-        return config
-
     def refresh_ports(self):
         current_port = self.port_combo.currentText()
         self.port_combo.clear()
         ports = [port.device for port in serial.tools.list_ports.comports()]
         self.port_combo.addItems(ports)
-        if current_port in ports:
+        if current_port in ports or bridge.BridgeConnection.is_bridge_url(current_port):
             self.port_combo.setCurrentText(current_port)
         elif ports:
             self.port_combo.setCurrentText(ports[0])
@@ -297,7 +292,7 @@ class TicTacToeGUI(QMainWindow):
             if self.serial_conn:
                 try:
                     self.serial_conn.write(b"\n")
-                    self.status_label.setText("Connected")
+                    self.status_label.setText("Spectating" if self.is_spectating() else "Connected")
                     self.status_label.setStyleSheet("color: green; font-weight: bold;")
                 except:
                     self.handle_disconnection()
@@ -316,6 +311,9 @@ class TicTacToeGUI(QMainWindow):
         self.ai_timer.stop()
         self.game_active = True
 
+    def is_spectating(self):
+        return getattr(self.serial_conn, 'is_spectator', False)
+
     def toggle_connection(self):
         if self.serial_conn is None:
             try:
@@ -323,15 +321,29 @@ class TicTacToeGUI(QMainWindow):
                 if not port:
                     raise ValueError("No port selected")
 
-                baud = int(self.baud_combo.currentText())
-                self.serial_conn = serial.Serial(port, baud, timeout=1)
+                is_bridge = bridge.BridgeConnection.is_bridge_url(port)
+                if is_bridge:
+                    self.serial_conn = bridge.BridgeConnection.from_url(port, timeout=1)
+                else:
+                    self.serial_conn = self.open_serial(port)
                 self.connect_btn.setText("Disconnect")
                 self.connect_btn.setStyleSheet("background-color: #ff4444; color: white;")
                 self.port_combo.setEnabled(False)
                 self.baud_combo.setEnabled(False)
-                self.status_label.setText("Connected")
                 self.status_label.setStyleSheet("color: green; font-weight: bold;")
-                self.reset_game()
+
+                if self.is_spectating():
+                    # Spectators only watch the board stream of the controlling client
+                    self.status_label.setText("Spectating")
+                    self.ai_timer.start(100)
+                    return
+
+                self.status_label.setText("Connected")
+                if is_bridge:
+                    self.reset_game()
+                else:
+                    # open_serial already reset the board
+                    self.clear_board()
 
                 if self.mode_combo.currentText() == 'AI vs AI':
                     self.ai_timer.start(100)
@@ -345,8 +357,60 @@ class TicTacToeGUI(QMainWindow):
             self.serial_conn.close()
             self.handle_disconnection()
 
+    def board_answers(self, conn, command, expected):
+        try:
+            conn.write(command)
+            return conn.readline().decode(errors='ignore').strip() == expected
+        except serial.SerialException:
+            return False
+
+    def device_id(self, port):
+        # Profiles follow the board, not the port it is plugged into
+        for info in serial.tools.list_ports.comports():
+            if info.device == port:
+                if info.serial_number:
+                    return f"SN:{info.serial_number}"
+                if info.vid is not None:
+                    return f"{info.vid:04X}:{info.pid:04X}@{info.location or ''}"
+        # Ports without USB details can only be told apart by name
+        return port
+
+    def connected_at(self, device, port, baud):
+        self.baud_combo.setCurrentText(baud)
+        self.config.set('Serial', 'baud_rate', baud)
+        self.config.save_profile(device, port, baud)
+
+    def open_serial(self, port):
+        device = self.device_id(port)
+        profile = self.config.get_profile(device)
+        if profile:
+            # Known board: a single RESET at the last good baud rate, no probing
+            conn = serial.Serial(port, int(profile['baud_rate']), timeout=1)
+            if self.board_answers(conn, b"RESET\n", "OK:RESET"):
+                self.connected_at(device, port, profile['baud_rate'])
+                return conn
+            conn.close()
+            # The saved rate no longer works, probe again right away
+            self.config.forget_profile(device)
+
+        # Each try blocks the GUI for up to a second, so only try the selected
+        # rate and the last one that worked
+        selected = self.baud_combo.currentText()
+        last_good = self.config.get('Serial', 'baud_rate')
+        bauds = list(dict.fromkeys([selected, last_good]))
+        for baud in bauds:
+            conn = serial.Serial(port, int(baud), timeout=1)
+            if (self.board_answers(conn, b"<test_connection/>\n", "<connection_ok/>")
+                    and self.board_answers(conn, b"RESET\n", "OK:RESET")):
+                self.connected_at(device, port, baud)
+                return conn
+            conn.close()
+
+        raise serial.SerialException(f"The board did not answer at {' or '.join(bauds)} baud")
+
     def change_mode(self):
-        if self.serial_conn:
+        self.config.set('Game', 'default_mode', self.mode_combo.currentText())
+        if self.serial_conn and not self.is_spectating():
             mode_map = {'Man vs Man': 1, 'Man vs AI': 2, 'AI vs AI': 3}
             mode = mode_map[self.mode_combo.currentText()]
             try:
@@ -371,7 +435,7 @@ class TicTacToeGUI(QMainWindow):
         if not self.game_active:
             return
 
-        if self.mode_combo.currentText() == 'AI vs AI':
+        if self.mode_combo.currentText() == 'AI vs AI' or self.is_spectating():
             return
 
         try:
@@ -450,7 +514,7 @@ class TicTacToeGUI(QMainWindow):
                     msg.exec_()
                     
                     self.game_active = False
-                    if self.mode_combo.currentText() == 'AI vs AI':
+                    if self.mode_combo.currentText() == 'AI vs AI' and not self.is_spectating():
                         self.ai_timer.stop()
                 elif "DRAW" in response:
                     msg = QMessageBox(self)
@@ -467,7 +531,7 @@ class TicTacToeGUI(QMainWindow):
                     msg.exec_()
                     
                     self.game_active = False
-                    if self.mode_combo.currentText() == 'AI vs AI':
+                    if self.mode_combo.currentText() == 'AI vs AI' and not self.is_spectating():
                         self.ai_timer.stop()
 
             elif response.startswith("ERR:"):
@@ -487,23 +551,37 @@ class TicTacToeGUI(QMainWindow):
 
     
     def check_ai_moves(self):
-        if self.serial_conn and self.mode_combo.currentText() == 'AI vs AI' and self.game_active:
-            if self.serial_conn.in_waiting:
-                self.process_response()
+        try:
+            if self.is_spectating():
+                # Handle every buffered line so a fast board stream never backs up
+                while self.is_spectating() and self.serial_conn.in_waiting:
+                    self.process_response()
+            elif self.serial_conn and self.mode_combo.currentText() == 'AI vs AI' and self.game_active:
+                if self.serial_conn.in_waiting:
+                    self.process_response()
+        except:
+            # The port or bridge went away, drop the dead connection
+            if self.serial_conn:
+                self.serial_conn.close()
+            self.handle_disconnection()
+
+    def clear_board(self):
+        for btn in self.board_buttons:
+            btn.setText("")
+            btn.setStyleSheet("")
+            btn.setEnabled(True)
+        self.game_active = True
 
     def reset_game(self):
-        if self.serial_conn:
+        if self.serial_conn and not self.is_spectating():
             try:
                 self.serial_conn.write(b"RESET\n")
                 response = self.serial_conn.readline().decode().strip()
                 if response == "OK:RESET":
-                    for btn in self.board_buttons:
-                        btn.setText("")
-                        btn.setStyleSheet("")
-                        btn.setEnabled(True)
-                    self.game_active = True
+                    self.clear_board()
                     if self.mode_combo.currentText() == 'AI vs AI':
                         self.ai_timer.start(100)
+                    return True
             except:
                 self.handle_disconnection()
         else:
@@ -511,6 +589,7 @@ class TicTacToeGUI(QMainWindow):
                 btn.setText("")
                 btn.setStyleSheet("")
             self.game_active = True
+        return False
 
     def closeEvent(self, event):
         try:
@@ -518,10 +597,8 @@ class TicTacToeGUI(QMainWindow):
                 self.serial_conn.close()
 
             # Save settings
-            self.config['Serial']['baud_rate'] = self.baud_combo.currentText()
-            self.config['Game']['default_mode'] = self.mode_combo.currentText()
-            with open('tictactoe.ini', 'w') as f:
-                self.config.write(f)
+            self.config.set('Game', 'default_mode', self.mode_combo.currentText())
+            self.config.close()
 
             if event:  # Перевіряємо, чи event не None
                 event.accept()
@@ -0,0 +1,174 @@
+import configparser
+import io
+import os
+import sys
+import tempfile
+import threading
+
+
+APP_NAME = 'TicTacToe'
+CONFIG_FILE = 'tictactoe.ini'
+WRITE_DELAY = 0.5
+PROFILE_PREFIX = 'Device:'
+
+# Every setting the GUI reads, with its default value
+SCHEMA = {
+    'Serial': {'baud_rate': '9600'},
+    'Game': {'default_mode': 'Man vs Man'},
+}
+
+
+def default_config_path():
+    if sys.platform == 'win32':
+        base = os.environ.get('APPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+    return os.path.join(base, APP_NAME, CONFIG_FILE)
+
+
+def write_atomic(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tictactoe-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # Readers see either the old file or the new one, never half of it
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ConfigStore:
+    """INI settings in a per-user location, written in the background when they change.
+
+    Missing settings are filled from SCHEMA. Changes are kept in memory and a
+    writer thread saves them a moment later, so a burst of changes becomes one
+    write. close() stops the writer and saves anything still pending.
+    """
+
+    def __init__(self, path=None, write_delay=WRITE_DELAY, legacy_path=CONFIG_FILE):
+        self.path = path or default_config_path()
+        self.write_delay = write_delay
+        self.config = configparser.ConfigParser(interpolation=None)
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.changed = threading.Event()
+        self.stopping = threading.Event()
+        self.dirty = False
+        self.load(legacy_path)
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def load(self, legacy_path=None):
+        # ConfigParser.read skips missing files, so check explicitly
+        try:
+            if os.path.exists(self.path):
+                self.config.read(self.path, encoding='utf-8')
+            elif legacy_path and os.path.exists(legacy_path):
+                # Copy settings from the old working-directory file, it is left in place
+                self.config.read(legacy_path, encoding='utf-8')
+                self.dirty = True
+            else:
+                self.dirty = True
+        except (configparser.Error, UnicodeDecodeError) as e:
+            # A broken file is replaced by the defaults below
+            print(f"Error reading settings, using defaults: {e}")
+            self.config = configparser.ConfigParser(interpolation=None)
+            self.dirty = True
+
+        for section, options in SCHEMA.items():
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            for key, value in options.items():
+                if not self.config.has_option(section, key):
+                    self.config.set(section, key, value)
+                    self.dirty = True
+
+        if self.dirty:
+            self.changed.set()
+
+    def get(self, section, key):
+        with self.lock:
+            return self.config.get(section, key, fallback=SCHEMA.get(section, {}).get(key))
+
+    def set(self, section, key, value):
+        value = str(value)
+        with self.lock:
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            elif self.config.get(section, key, fallback=None) == value:
+                return False
+            self.config.set(section, key, value)
+            self.dirty = True
+            self.changed.set()
+        return True
+
+    def get_profile(self, device):
+        section = PROFILE_PREFIX + device
+        with self.lock:
+            if not self.config.has_section(section):
+                return None
+            baud_rate = self.config.get(section, 'baud_rate', fallback='')
+            if not baud_rate.isdigit():
+                # An unusable profile is dropped so the board gets probed again
+                self.config.remove_section(section)
+                self.dirty = True
+                self.changed.set()
+                return None
+            return {
+                'device': device,
+                'port': self.config.get(section, 'port', fallback=''),
+                'baud_rate': baud_rate,
+            }
+
+    def save_profile(self, device, port, baud_rate):
+        section = PROFILE_PREFIX + device
+        self.set(section, 'port', port)
+        self.set(section, 'baud_rate', baud_rate)
+
+    def forget_profile(self, device):
+        with self.lock:
+            if self.config.remove_section(PROFILE_PREFIX + device):
+                self.dirty = True
+                self.changed.set()
+
+    def flush(self):
+        with self.write_lock:
+            with self.lock:
+                if not self.dirty:
+                    return False
+                self.changed.clear()
+                buffer = io.StringIO()
+                self.config.write(buffer)
+                self.dirty = False
+            try:
+                write_atomic(self.path, buffer.getvalue())
+            except OSError:
+                # Wake the writer again so the save is retried
+                with self.lock:
+                    self.dirty = True
+                    self.changed.set()
+                raise
+        return True
+
+    def write_loop(self):
+        while not self.stopping.is_set():
+            self.changed.wait()
+            # Let a burst of changes settle into a single write
+            if self.stopping.wait(self.write_delay):
+                break
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"Error saving settings: {e}")
+
+    def close(self):
+        self.stopping.set()
+        self.changed.set()
+        self.writer.join()
+        self.flush()
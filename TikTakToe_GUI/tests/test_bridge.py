@@ -0,0 +1,263 @@
+import asyncio
+import queue
+import socket
+import threading
+
+import serial
+
+import bridge
+from tests.test_tictactoe import JsonLogger
+
+
+class FakeSerial:
+    """Stand-in for the Arduino that answers MOVE commands with a BOARD line."""
+
+    def __init__(self):
+        self.lines = queue.Queue()
+        self.written = []
+
+    def readline(self):
+        try:
+            return self.lines.get(timeout=0.05)
+        except queue.Empty:
+            return b''
+
+    def write(self, data):
+        self.written.append(data)
+        if data.startswith(b"MOVE9"):
+            self.lines.put(b"ERR:INVALID_MOVE\n")
+        elif data.startswith(b"MOVE"):
+            self.lines.put(b"BOARD:000010000:CONTINUE\n")
+        return len(data)
+
+
+class UnpluggedSerial:
+    """Serial port that fails on read or write once the board is unplugged."""
+
+    def __init__(self, fail_read=True):
+        self.fail_read = fail_read
+        self.unplugged = threading.Event()
+
+    def readline(self):
+        if self.fail_read and self.unplugged.wait(0.05):
+            raise serial.SerialException("unplugged")
+        return b''
+
+    def write(self, data):
+        if self.unplugged.is_set():
+            raise serial.SerialException("unplugged")
+        return len(data)
+
+
+async def open_client(port, recv_buffer=None):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if recv_buffer:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer)
+    sock.connect(('127.0.0.1', port))
+    reader, writer = await asyncio.open_connection(sock=sock)
+    greeting = (await reader.readline()).decode().strip()
+    return reader, writer, greeting
+
+
+async def read_until(reader, expected, timeout=10):
+    async def wait():
+        while True:
+            line = (await reader.readline()).decode().strip()
+            if line == expected:
+                return line
+    return await asyncio.wait_for(wait(), timeout)
+
+
+class TestSerialBridge:
+    json_logger = JsonLogger("results/test_bridge_results.json")
+
+    def setup_method(self, method):
+        """Підготовка перед кожним тестом"""
+        self.json_logger.log("INFO", f"Starting test method: {method.__name__}")
+
+    def test_first_client_controls_and_spectators_are_read_only(self):
+        """Перевірка розподілу ролей між клієнтами моста"""
+        async def scenario():
+            fake = FakeSerial()
+            server = bridge.SerialBridge(fake, port=0)
+            await server.start()
+            try:
+                c_reader, c_writer, c_greeting = await open_client(server.port)
+                s_reader, s_writer, s_greeting = await open_client(server.port)
+                assert c_greeting == "OK:CONTROL"
+                assert s_greeting == "OK:SPECTATOR"
+
+                s_writer.write(b"MOVE0\n")
+                assert await read_until(s_reader, "ERR:SPECTATOR")
+
+                # Board errors reach only the client that caused them
+                c_writer.write(b"MOVE9\n")
+                await read_until(c_reader, "ERR:INVALID_MOVE")
+
+                c_writer.write(b"MOVE4\n")
+                await read_until(c_reader, "BOARD:000010000:CONTINUE")
+                assert (await s_reader.readline()).decode().strip() == "BOARD:000010000:CONTINUE"
+                assert fake.written == [b"MOVE9\n", b"MOVE4\n"]
+
+                # Control is released when the controller leaves
+                c_writer.close()
+                await c_writer.wait_closed()
+                await asyncio.sleep(0.1)
+                _, n_writer, n_greeting = await open_client(server.port)
+                assert n_greeting == "OK:CONTROL"
+                for writer in (s_writer, n_writer):
+                    writer.close()
+            finally:
+                await server.stop()
+
+        try:
+            asyncio.run(scenario())
+            self.json_logger.log("INFO", "Bridge roles test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Bridge roles test failed: {str(e)}")
+            raise
+
+    def test_board_stream_reaches_hundreds_of_spectators(self):
+        """Навантажувальний тест: сотні глядачів отримують потік BOARD:"""
+        spectator_count = 300
+        line_count = 20
+
+        async def scenario():
+            fake = FakeSerial()
+            server = bridge.SerialBridge(fake, port=0)
+            await server.start()
+            try:
+                _, c_writer, _ = await open_client(server.port)
+                spectators = [await open_client(server.port) for _ in range(spectator_count)]
+                assert all(greeting == "OK:SPECTATOR" for _, _, greeting in spectators)
+
+                for i in range(line_count):
+                    fake.lines.put(f"BOARD:00000000{i % 3}:CONTINUE:{i}\n".encode())
+
+                async def collect(reader):
+                    lines = []
+                    while len(lines) < line_count:
+                        lines.append((await reader.readline()).decode().strip())
+                    return lines
+
+                results = await asyncio.wait_for(
+                    asyncio.gather(*(collect(reader) for reader, _, _ in spectators)), 30)
+                expected = [f"BOARD:00000000{i % 3}:CONTINUE:{i}" for i in range(line_count)]
+                assert all(lines == expected for lines in results)
+
+                c_writer.close()
+                for _, writer, _ in spectators:
+                    writer.close()
+            finally:
+                await server.stop()
+
+        try:
+            asyncio.run(scenario())
+            self.json_logger.log("INFO", "Bridge load test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Bridge load test failed: {str(e)}")
+            raise
+
+    def test_slow_spectator_does_not_stall_serial_reader(self):
+        """Перевірка, що повільний глядач не блокує читання з порту"""
+        queue_size = 8
+        line_count = 20000
+
+        async def scenario():
+            fake = FakeSerial()
+            server = bridge.SerialBridge(fake, port=0, queue_size=queue_size)
+            await server.start()
+            try:
+                _, c_writer, _ = await open_client(server.port)
+                # This spectator never reads its socket
+                _, slow_writer, _ = await open_client(server.port, recv_buffer=4096)
+                fast_reader, fast_writer, _ = await open_client(server.port)
+
+                padding = "0" * 500
+                for i in range(line_count):
+                    fake.lines.put(f"BOARD:000000000:CONTINUE:{padding}:{i}\n".encode())
+
+                await read_until(fast_reader, f"BOARD:000000000:CONTINUE:{padding}:{line_count - 1}", 30)
+                assert fake.lines.empty()
+                assert all(client.queue.qsize() <= queue_size for client in server.clients)
+                assert max(client.dropped for client in server.clients) > 0
+
+                for writer in (c_writer, slow_writer, fast_writer):
+                    writer.close()
+            finally:
+                await server.stop()
+
+        try:
+            asyncio.run(scenario())
+            self.json_logger.log("INFO", "Slow spectator test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Slow spectator test failed: {str(e)}")
+            raise
+
+    def test_bridge_connection_acts_like_serial(self):
+        """Перевірка клієнта моста, сумісного з serial.Serial"""
+        async def scenario():
+            fake = FakeSerial()
+            server = bridge.SerialBridge(fake, port=0)
+            await server.start()
+            try:
+                url = f"tcp://127.0.0.1:{server.port}"
+                assert bridge.BridgeConnection.is_bridge_url(url)
+                assert not bridge.BridgeConnection.is_bridge_url("COM3")
+
+                conn = await asyncio.to_thread(bridge.BridgeConnection.from_url, url)
+                assert not conn.is_spectator
+                await asyncio.to_thread(conn.write, b"MOVE4\n")
+                response = await asyncio.to_thread(conn.readline)
+                assert response.decode().strip() == "BOARD:000010000:CONTINUE"
+                assert conn.in_waiting == 0
+
+                # A partial line is not reported as waiting
+                conn.buffer = b"BOARD:0000"
+                assert conn.in_waiting == 0
+                conn.buffer = b"OK:RESET\nBOARD:0000"
+                assert conn.in_waiting == len(b"OK:RESET\n")
+                conn.close()
+            finally:
+                await server.stop()
+
+        try:
+            asyncio.run(scenario())
+            self.json_logger.log("INFO", "Bridge connection test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Bridge connection test failed: {str(e)}")
+            raise
+
+    def check_unplugged_board(self, fail_read):
+        async def scenario():
+            fake = UnpluggedSerial(fail_read)
+            server = bridge.SerialBridge(fake, port=0)
+            serve_task = asyncio.create_task(server.serve_forever())
+            while server.reader_task is None:
+                await asyncio.sleep(0.01)
+
+            c_reader, c_writer, _ = await open_client(server.port)
+            s_reader, s_writer, _ = await open_client(server.port)
+            fake.unplugged.set()
+            c_writer.write(b"MOVE4\n")
+
+            # Every client is disconnected and the bridge stops serving
+            for reader in (c_reader, s_reader):
+                await asyncio.wait_for(reader.read(), 5)
+                assert reader.at_eof()
+            await asyncio.wait_for(serve_task, 5)
+            assert not server.server.is_serving()
+            for writer in (c_writer, s_writer):
+                writer.close()
+
+        asyncio.run(scenario())
+
+    def test_unplugged_board_disconnects_everyone(self):
+        """Перевірка відключення всіх клієнтів, коли плату від'єднано"""
+        try:
+            self.check_unplugged_board(fail_read=True)
+            self.check_unplugged_board(fail_read=False)
+            self.json_logger.log("INFO", "Unplugged board test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Unplugged board test failed: {str(e)}")
+            raise
@@ -0,0 +1,198 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+import serial.tools.list_ports
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication, QMessageBox
+
+import main
+import settings
+from tests.test_tictactoe import JsonLogger
+
+
+app = QApplication.instance() or QApplication([])
+
+
+class FakeBoard:
+    """Arduino that only answers at one baud rate, records every port it opens."""
+
+    def __init__(self, good_baud):
+        self.good_baud = good_baud
+        self.opened = []
+
+    def __call__(self, port, baud, timeout=1):
+        board = FakeBoardPort(self, port, baud)
+        self.opened.append(board)
+        return board
+
+
+class FakeBoardPort:
+    in_waiting = 0
+
+    def __init__(self, board, port, baud):
+        self.board = board
+        self.port = port
+        self.baud = baud
+        self.written = []
+        self.replies = []
+
+    def write(self, data):
+        self.written.append(data)
+        if self.baud != self.board.good_baud:
+            return len(data)
+        if data == b"<test_connection/>\n":
+            self.replies.append(b"<connection_ok/>\n")
+        elif data == b"RESET\n":
+            self.replies.append(b"OK:RESET\n")
+        return len(data)
+
+    def readline(self):
+        return self.replies.pop(0) if self.replies else b''
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    path = str(tmp_path / 'user' / 'tictactoe.ini')
+    # An existing user file keeps a stray working-directory INI out of the test
+    settings.ConfigStore(path, legacy_path=None).close()
+    monkeypatch.setattr(settings, 'default_config_path', lambda: path)
+    monkeypatch.setattr(QMessageBox, 'critical', lambda *args: None)
+    return path
+
+
+def plug(monkeypatch, **ports):
+    """Pretend USB boards with the given serial numbers sit on the given ports."""
+    infos = [SimpleNamespace(device=port, serial_number=number, vid=0x2341, pid=0x0043,
+                             location='1-1')
+             for port, number in ports.items()]
+    monkeypatch.setattr(serial.tools.list_ports, 'comports', lambda: infos)
+
+
+def connect(monkeypatch, board, port, baud=None):
+    monkeypatch.setattr(main.serial, 'Serial', board)
+    window = main.TicTacToeGUI()
+    window.port_combo.setCurrentText(port)
+    if baud:
+        window.baud_combo.setCurrentText(baud)
+    window.toggle_connection()
+    return window
+
+
+class TestDeviceReconnect:
+    json_logger = JsonLogger("results/test_reconnect_results.json")
+
+    def setup_method(self, method):
+        """Підготовка перед кожним тестом"""
+        self.json_logger.log("INFO", f"Starting test method: {method.__name__}")
+
+    def test_known_board_connects_without_probing(self, config_path, monkeypatch):
+        """Перевірка підключення до відомої плати за один обмін"""
+        try:
+            store = settings.ConfigStore(config_path)
+            store.save_profile('SN:A1', 'COM3', '57600')
+            store.close()
+
+            # The same board plugged into another port keeps its profile
+            plug(monkeypatch, COM7='A1')
+            board = FakeBoard(57600)
+            window = connect(monkeypatch, board, 'COM7')
+            assert [p.baud for p in board.opened] == [57600]
+            assert board.opened[0].written == [b"RESET\n"]
+            assert window.baud_combo.currentText() == '57600'
+            assert window.config.get_profile('SN:A1')['port'] == 'COM7'
+            window.closeEvent(None)
+            self.json_logger.log("INFO", "Known board reconnect test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Known board reconnect test failed: {str(e)}")
+            raise
+
+    def test_unknown_board_is_probed_and_saved(self, config_path, monkeypatch):
+        """Перевірка пошуку швидкості для нової плати та збереження профілю"""
+        try:
+            store = settings.ConfigStore(config_path)
+            store.set('Serial', 'baud_rate', '38400')
+            store.close()
+
+            # Only the selected rate and the last good one are tried
+            plug(monkeypatch, COM8='B2')
+            board = FakeBoard(38400)
+            window = connect(monkeypatch, board, 'COM8', baud='19200')
+            assert [p.baud for p in board.opened] == [19200, 38400]
+            assert board.opened[-1].written == [b"<test_connection/>\n", b"RESET\n"]
+            window.closeEvent(None)
+
+            saved = settings.ConfigStore(config_path)
+            assert saved.get_profile('SN:B2') == {
+                'device': 'SN:B2',
+                'port': 'COM8',
+                'baud_rate': '38400',
+            }
+            saved.close()
+            self.json_logger.log("INFO", "Unknown board probe test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Unknown board probe test failed: {str(e)}")
+            raise
+
+    def test_failed_reset_probes_again(self, config_path, monkeypatch):
+        """Перевірка повторного пошуку швидкості після невдалого RESET"""
+        try:
+            store = settings.ConfigStore(config_path)
+            store.save_profile('SN:C3', 'COM9', '9600')
+            store.close()
+
+            plug(monkeypatch, COM9='C3')
+            board = FakeBoard(115200)
+            window = connect(monkeypatch, board, 'COM9', baud='115200')
+            assert [p.baud for p in board.opened] == [9600, 115200]
+            assert board.opened[-1].written == [b"<test_connection/>\n", b"RESET\n"]
+            assert window.serial_conn is board.opened[-1]
+            assert window.status_label.text() == "Connected"
+            assert window.config.get_profile('SN:C3')['baud_rate'] == '115200'
+            window.closeEvent(None)
+            self.json_logger.log("INFO", "Stale profile test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Stale profile test failed: {str(e)}")
+            raise
+
+    def test_silent_board_is_not_connected(self, config_path, monkeypatch):
+        """Перевірка, що плата без відповіді не вважається підключеною"""
+        try:
+            plug(monkeypatch)
+            board = FakeBoard(57600)
+            window = connect(monkeypatch, board, 'COM5')
+            assert [p.baud for p in board.opened] == [9600]
+            assert window.serial_conn is None
+            # A port without USB details is keyed by its name
+            assert window.device_id('COM5') == 'COM5'
+            assert window.config.get_profile('COM5') is None
+            window.closeEvent(None)
+            self.json_logger.log("INFO", "Silent board test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Silent board test failed: {str(e)}")
+            raise
+
+    def test_other_board_on_known_port_is_probed(self, config_path, monkeypatch):
+        """Перевірка, що інша плата на тому ж порту не отримує чужий профіль"""
+        try:
+            store = settings.ConfigStore(config_path)
+            store.save_profile('SN:A1', 'COM3', '57600')
+            store.close()
+
+            plug(monkeypatch, COM3='D4')
+            board = FakeBoard(9600)
+            window = connect(monkeypatch, board, 'COM3')
+            assert [p.baud for p in board.opened] == [9600]
+            assert board.opened[0].written[0] == b"<test_connection/>\n"
+            assert window.config.get_profile('SN:D4')['baud_rate'] == '9600'
+            assert window.config.get_profile('SN:A1')['baud_rate'] == '57600'
+            window.closeEvent(None)
+            self.json_logger.log("INFO", "Other board test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Other board test failed: {str(e)}")
+            raise
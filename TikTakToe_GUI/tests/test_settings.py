@@ -0,0 +1,166 @@
+import configparser
+import os
+import time
+
+import settings
+from tests.test_tictactoe import JsonLogger
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestConfigStore:
+    json_logger = JsonLogger("results/test_settings_results.json")
+
+    def setup_method(self, method):
+        """Підготовка перед кожним тестом"""
+        self.json_logger.log("INFO", f"Starting test method: {method.__name__}")
+
+    def test_missing_file_is_filled_from_schema(self, tmp_path):
+        """Перевірка створення налаштувань за замовчуванням, якщо файлу немає"""
+        try:
+            path = tmp_path / 'user' / 'tictactoe.ini'
+            store = settings.ConfigStore(str(path), write_delay=0.01,
+                                         legacy_path=str(tmp_path / 'missing.ini'))
+            assert store.get('Serial', 'baud_rate') == '9600'
+            assert store.get('Game', 'default_mode') == 'Man vs Man'
+            store.close()
+
+            loaded = configparser.ConfigParser()
+            loaded.read(path)
+            assert loaded['Serial']['baud_rate'] == '9600'
+            assert loaded['Game']['default_mode'] == 'Man vs Man'
+            self.json_logger.log("INFO", "Schema defaults test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Schema defaults test failed: {str(e)}")
+            raise
+
+    def test_changes_are_written_in_background_only_when_changed(self, tmp_path):
+        """Перевірка фонового запису лише змінених налаштувань"""
+        try:
+            path = tmp_path / 'tictactoe.ini'
+            store = settings.ConfigStore(str(path), write_delay=0.01)
+            assert wait_for(path.exists)
+            assert wait_for(lambda: not store.dirty)
+
+            assert not store.set('Serial', 'baud_rate', '9600')
+            assert not store.flush()
+
+            assert store.set('Serial', 'baud_rate', '115200')
+            assert wait_for(lambda: 'baud_rate = 115200' in path.read_text())
+            # No temporary files are left next to the config
+            assert os.listdir(tmp_path) == ['tictactoe.ini']
+            store.close()
+            self.json_logger.log("INFO", "Write-behind test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Write-behind test failed: {str(e)}")
+            raise
+
+    def test_device_profile_round_trip(self, tmp_path):
+        """Перевірка збереження профілю пристрою"""
+        try:
+            path = str(tmp_path / 'tictactoe.ini')
+            store = settings.ConfigStore(path, write_delay=0.01)
+            assert store.get_profile('SN:A1') is None
+            store.save_profile('SN:A1', 'COM3', '57600')
+            store.close()
+
+            reloaded = settings.ConfigStore(path, write_delay=0.01)
+            assert reloaded.get_profile('SN:A1') == {
+                'device': 'SN:A1',
+                'port': 'COM3',
+                'baud_rate': '57600',
+            }
+            reloaded.forget_profile('SN:A1')
+            assert reloaded.get_profile('SN:A1') is None
+            reloaded.close()
+            self.json_logger.log("INFO", "Device profile test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Device profile test failed: {str(e)}")
+            raise
+
+    def test_legacy_config_is_copied(self, tmp_path):
+        """Перевірка копіювання старого файлу з робочої директорії"""
+        try:
+            legacy = tmp_path / 'legacy.ini'
+            legacy.write_text("[Serial]\nbaud_rate = 38400\n")
+            path = tmp_path / 'user' / 'tictactoe.ini'
+            store = settings.ConfigStore(str(path), write_delay=0.01, legacy_path=str(legacy))
+            assert store.get('Serial', 'baud_rate') == '38400'
+            assert store.get('Game', 'default_mode') == 'Man vs Man'
+            store.close()
+            assert 'baud_rate = 38400' in path.read_text()
+            self.json_logger.log("INFO", "Legacy config copy test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Legacy config copy test failed: {str(e)}")
+            raise
+
+    def test_corrupt_file_falls_back_to_defaults(self, tmp_path):
+        """Перевірка відновлення налаштувань із пошкодженого файлу"""
+        try:
+            path = tmp_path / 'tictactoe.ini'
+            path.write_text("baud_rate = 9600\n")
+            store = settings.ConfigStore(str(path), write_delay=0.01)
+            assert store.get('Serial', 'baud_rate') == '9600'
+            assert store.get('Game', 'default_mode') == 'Man vs Man'
+            store.close()
+
+            loaded = configparser.ConfigParser()
+            loaded.read(path)
+            assert loaded['Serial']['baud_rate'] == '9600'
+
+            # A file saved in a legacy Windows encoding is not valid UTF-8
+            path.write_bytes("[Game]\ndefault_mode = Людина\n".encode('cp1251'))
+            store = settings.ConfigStore(str(path), write_delay=0.01)
+            assert store.get('Game', 'default_mode') == 'Man vs Man'
+            store.close()
+            self.json_logger.log("INFO", "Corrupt config test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Corrupt config test failed: {str(e)}")
+            raise
+
+    def test_invalid_profile_is_dropped(self, tmp_path):
+        """Перевірка видалення профілю без коректної швидкості"""
+        try:
+            path = tmp_path / 'tictactoe.ini'
+            path.write_text("[Device:COM3]\nport = COM3\n\n"
+                            "[Device:COM4]\nbaud_rate = fast\n")
+            store = settings.ConfigStore(str(path), write_delay=0.01)
+            assert store.get_profile('COM3') is None
+            assert store.get_profile('COM4') is None
+            store.close()
+            assert 'Device:' not in path.read_text()
+            self.json_logger.log("INFO", "Invalid profile test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Invalid profile test failed: {str(e)}")
+            raise
+
+    def test_failed_write_is_retried(self, tmp_path, monkeypatch):
+        """Перевірка повторного запису після помилки"""
+        try:
+            path = tmp_path / 'tictactoe.ini'
+            write_atomic = settings.write_atomic
+            failures = []
+
+            def flaky_write(target, data):
+                if not failures:
+                    failures.append(target)
+                    raise OSError("disk full")
+                write_atomic(target, data)
+
+            monkeypatch.setattr(settings, 'write_atomic', flaky_write)
+            store = settings.ConfigStore(str(path), write_delay=0.01)
+            assert wait_for(path.exists)
+            assert failures
+            assert wait_for(lambda: not store.dirty)
+            store.close()
+            self.json_logger.log("INFO", "Write retry test passed")
+        except AssertionError as e:
+            self.json_logger.log("ERROR", f"Write retry test failed: {str(e)}")
+            raise